@@ -1,4 +1,7 @@
 import heapq
+from array import array
+import math
+import sys
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 from enum import Enum
@@ -9,116 +12,339 @@ class TaskStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
+MIN_PRIORITY = 1
+MAX_PRIORITY = 10
+
+# Integer status codes, indexed in TaskStatus order
+_STATUSES = tuple(TaskStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+
 class Task:
+    # No per-instance __dict__: smaller tasks and faster attribute access
+    __slots__ = ('id', 'duration', 'priority', 'dependencies', 'deadline', '_status',
+                 'start_time', 'end_time')
+
+    # Hot-path status codes; the status property maps them to TaskStatus
+    PENDING = _STATUS_CODES[TaskStatus.PENDING]
+    RUNNING = _STATUS_CODES[TaskStatus.RUNNING]
+    COMPLETED = _STATUS_CODES[TaskStatus.COMPLETED]
+    FAILED = _STATUS_CODES[TaskStatus.FAILED]
+
     def __init__(self, id: str, duration: int, priority: int = 1, 
                  dependencies: List[str] = None, deadline: datetime = None):
+        if not isinstance(priority, int) or not MIN_PRIORITY <= priority <= MAX_PRIORITY:
+            raise ValueError(f"Priority must be an integer between {MIN_PRIORITY} and {MAX_PRIORITY}!")
         self.id = id
         self.duration = duration  # in minutes
         self.priority = priority  # 1-10, where 10 is highest
-        self.dependencies = dependencies or []
+        # Duplicates would inflate the remaining-dependency count
+        self.dependencies = list(dict.fromkeys(dependencies or []))
+        if id in self.dependencies:
+            raise ValueError(f"Task {id} cannot depend on itself!")
         self.deadline = deadline
-        self.status = TaskStatus.PENDING
+        self._status = Task.PENDING
         self.start_time = None
         self.end_time = None
         
+    @property
+    def status(self) -> TaskStatus:
+        return _STATUSES[self._status]
+
+    @status.setter
+    def status(self, status: TaskStatus):
+        if not isinstance(status, TaskStatus):
+            raise ValueError(f"Status must be a TaskStatus member, not {status!r}!")
+        self._status = _STATUS_CODES[status]
+
     def __lt__(self, other):
-        # For priority queue: higher priority tasks come first
-        if self.priority == other.priority:
-            if self.deadline and other.deadline:
-                return self.deadline < other.deadline
-            return self.duration < other.duration
-        return self.priority > other.priority
+        # Scheduling order: higher priority first, then earlier deadline
+        # (tasks without one last), then shorter duration
+        return ((-self.priority, self.deadline is None, self.deadline, self.duration)
+                < (-other.priority, other.deadline is None, other.deadline, other.duration))
 
     def __str__(self):
         return f"Task {self.id}: Duration={self.duration}min, Priority={self.priority}, Dependencies={self.dependencies}, Deadline={self.deadline}"
 
+class TaskTable:
+    """Struct-of-arrays storage for the fields the scheduler works on.
+
+    Row i describes tasks[i], and id_to_idx maps a task id to its row.
+    Only pending tasks have rows; a run removes the rows it schedules.
+    Removal moves the last row into the freed slot, so row order is not
+    insertion order; seq numbers the rows in the order they were added.
+    Keeping each numeric field in its own typed array lets the scheduling
+    and metrics loops index contiguous columns instead of chasing
+    attributes spread across Task objects.
+    """
+
+    def __init__(self):
+        self.tasks: List[Task] = []
+        self.id_to_idx: Dict[str, int] = {}
+        self.duration = array('d')  # minutes; fractional durations are allowed
+        self.priority = array('b')
+        self.deadline_min = array('d')  # inf when the task has no deadline
+        self.remaining_deps = array('q')
+        self.start_min = array('d')
+        self.end_min = array('d')
+        self.seq = array('q')  # insertion number, the final scheduling tie-break
+        self._next_seq = 0
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def _columns(self):
+        return (self.tasks, self.duration, self.priority, self.deadline_min,
+                self.remaining_deps, self.start_min, self.end_min, self.seq)
+
+    def append(self, task: Task, deadline_min: float, remaining_deps: int) -> int:
+        """Add a row for the task and return its index"""
+        idx = len(self.tasks)
+        self.id_to_idx[task.id] = idx
+        self.tasks.append(task)
+        self.duration.append(task.duration)
+        self.priority.append(task.priority)
+        self.deadline_min.append(deadline_min)
+        self.remaining_deps.append(remaining_deps)
+        self.start_min.append(0.0)
+        self.end_min.append(0.0)
+        self.seq.append(self._next_seq)
+        self._next_seq += 1
+        return idx
+
+    def remove(self, task_id: str):
+        """Drop a task's row by moving the last row into its place"""
+        idx = self.id_to_idx.pop(task_id)
+        last = len(self.tasks) - 1
+        for column in self._columns():
+            column[idx] = column[last]
+            column.pop()
+        if idx != last:
+            self.id_to_idx[self.tasks[idx].id] = idx
+
+class _PriorityBuckets:
+    """Ready queue with one bucket per priority level.
+
+    Priorities are bounded, so popping scans at most MAX_PRIORITY buckets
+    instead of sifting through a heap of every ready task. Each bucket is
+    a small heap of entries ordered by the rest of the sort key.
+    """
+
+    def __init__(self):
+        self._buckets = [[] for _ in range(MAX_PRIORITY + 1)]
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, priority: int, entry: tuple):
+        heapq.heappush(self._buckets[priority], entry)
+        self._size += 1
+
+    def pop(self) -> tuple:
+        for priority in range(MAX_PRIORITY, MIN_PRIORITY - 1, -1):
+            bucket = self._buckets[priority]
+            if bucket:
+                self._size -= 1
+                return heapq.heappop(bucket)
+        raise IndexError("pop from an empty queue")
+
+def _schedule_core(priority, duration, deadline_min, seq, remaining_deps,
+                   child_indptr, child_indices, ready, start_min, end_min) -> List[int]:
+    """Run the scheduling loop over TaskTable columns.
+
+    Works purely on row indices and numbers: starting from the ``ready``
+    rows, repeatedly runs the best ready row (highest priority, then
+    earliest deadline, then shortest duration, then first added) from
+    minute offset 0 and releases its children, given as a CSR adjacency.
+    Fills start_min, end_min and remaining_deps in place and
+    returns the rows in execution order.
+    """
+    order = []
+    
+    # Create priority queue from the tasks with no unfinished dependencies;
+    # entries are (deadline, duration, seq, row) within each priority bucket
+    task_queue = _PriorityBuckets()
+    for idx in ready:
+        task_queue.push(priority[idx], (deadline_min[idx], duration[idx], seq[idx], idx))
+    
+    cur = 0
+    while task_queue:
+        idx = task_queue.pop()[3]
+        
+        # Schedule the task and simulate its execution
+        start_min[idx] = cur
+        cur += duration[idx]
+        end_min[idx] = cur
+        order.append(idx)
+        
+        # Release tasks whose last unfinished dependency was this one
+        for k in range(child_indptr[idx], child_indptr[idx + 1]):
+            child = child_indices[k]
+            remaining_deps[child] -= 1
+            if remaining_deps[child] == 0:
+                task_queue.push(priority[child], (deadline_min[child], duration[child], seq[child], child))
+    
+    return order
+
+def _schedule_sorted(priority, duration, deadline_min, seq, rows, start_min, end_min) -> List[int]:
+    """Schedule independent rows in one sorted pass.
+
+    With no dependencies to release, nothing joins the queue mid-run, so
+    the schedule is simply the rows sorted by the same key _schedule_core
+    uses: (-priority, deadline, duration, seq).
+    """
+    order = sorted(rows, key=lambda idx: (-priority[idx], deadline_min[idx], duration[idx], seq[idx]))
+    cur = 0
+    for idx in order:
+        start_min[idx] = cur
+        cur += duration[idx]
+        end_min[idx] = cur
+    return order
+
 class TaskScheduler:
     def __init__(self):
-        self.tasks = {}
-        self.completed_tasks = []
+        self.tasks = {}  # every task ever added, scheduled or not
+        self.pending_ids = set()
+        self.table = TaskTable()
+        self.completed_order = []  # tasks in the order they ran; hot paths use completed_ids
+        self.completed_ids = set()
+        self.dependents = {}  # dependency id -> ids of tasks waiting on it
         self.current_time = datetime.now()
+        # Scheduling arithmetic is done in plain minute offsets from this
+        # instant, which each run resets to its own start
+        self.epoch = self.current_time
         
     def add_task(self, task: Task):
         """Add a task to the scheduler"""
+        if task.id in self.tasks:
+            self.remove_task(task.id)
         self.tasks[task.id] = task
+        if task._status != Task.PENDING:
+            return
+        self.pending_ids.add(task.id)
+        remaining_deps = 0
+        for dep_id in task.dependencies:
+            if dep_id not in self.completed_ids:
+                remaining_deps += 1
+                self.dependents.setdefault(dep_id, []).append(task.id)
+        self.table.append(task, self._deadline_offset(task.deadline), remaining_deps)
+        
+    def _deadline_offset(self, deadline: datetime) -> float:
+        """Minutes from the epoch to a deadline, or inf when there is none"""
+        return (deadline - self.epoch).total_seconds() / 60 if deadline else math.inf
         
     def remove_task(self, task_id: str):
         """Remove a task from the scheduler"""
         if task_id in self.tasks:
-            del self.tasks[task_id]
+            task = self.tasks.pop(task_id)
+            if task_id not in self.pending_ids:
+                return
+            self.pending_ids.remove(task_id)
+            self.table.remove(task_id)
+            for dep_id in task.dependencies:
+                if dep_id in self.dependents:
+                    self.dependents[dep_id].remove(task_id)
             
     def get_ready_tasks(self) -> List[Task]:
         """Get tasks that have all dependencies satisfied"""
-        ready_tasks = []
-        for task in self.tasks.values():
-            if task.status == TaskStatus.PENDING:
-                # Check if all dependencies are completed
-                dependencies_met = all(
-                    dep_id in [t.id for t in self.completed_tasks] 
-                    for dep_id in task.dependencies
-                )
-                if not task.dependencies or dependencies_met:
-                    ready_tasks.append(task)
-        return ready_tasks
+        return [self.table.tasks[idx] for idx in self._ready_rows()]
+    
+    def _ready_rows(self) -> List[int]:
+        """Table rows of pending tasks with no unfinished dependencies, in insertion order"""
+        remaining_deps = self.table.remaining_deps
+        return sorted(
+            (idx for idx in range(len(remaining_deps)) if remaining_deps[idx] == 0),
+            key=self.table.seq.__getitem__,
+        )
+    
+    def _child_csr(self):
+        """Reverse adjacency by row in CSR form
+        
+        Returns ``(indptr, indices)`` where the rows waiting on row i are
+        ``indices[indptr[i]:indptr[i + 1]]``.
+        """
+        id_to_idx = self.table.id_to_idx
+        n = len(self.table)
+        parents = [
+            (id_to_idx[dep_id], child_ids)
+            for dep_id, child_ids in self.dependents.items() if dep_id in id_to_idx
+        ]
+        
+        indptr = array('q', [0]) * (n + 1)
+        for parent, child_ids in parents:
+            indptr[parent + 1] = len(child_ids)
+        for i in range(n):
+            indptr[i + 1] += indptr[i]
+        
+        indices = array('q', [0]) * indptr[n]
+        for parent, child_ids in parents:
+            indices[indptr[parent]:indptr[parent + 1]] = array('q', map(id_to_idx.__getitem__, child_ids))
+        return indptr, indices
     
     def schedule_tasks(self) -> List[Task]:
         """Schedule tasks using priority-based scheduling with deadline awareness"""
-        scheduled_tasks = []
-        ready_tasks = self.get_ready_tasks()
+        table = self.table
+        ready = self._ready_rows()
+        # Each run starts now at offset 0, so pending deadlines are re-based;
+        # priority and duration are re-read too, as the task may have changed
+        self.current_time = self.epoch = datetime.now()
+        for idx, task in enumerate(table.tasks):
+            table.priority[idx] = task.priority
+            table.duration[idx] = task.duration
+            table.deadline_min[idx] = self._deadline_offset(task.deadline)
         
-        # Create priority queue
-        task_queue = []
-        for task in ready_tasks:
-            heapq.heappush(task_queue, task)
-            
-        current_time = self.current_time
+        if len(ready) == len(table):
+            # Fast path: nothing waits on anything, so one sort is the schedule
+            order = _schedule_sorted(
+                table.priority, table.duration, table.deadline_min, table.seq,
+                ready, table.start_min, table.end_min,
+            )
+        else:
+            indptr, indices = self._child_csr()
+            order = _schedule_core(
+                table.priority, table.duration, table.deadline_min, table.seq,
+                table.remaining_deps, indptr, indices, ready, table.start_min, table.end_min,
+            )
         
-        while task_queue:
-            task = heapq.heappop(task_queue)
+        # Copy results back onto the Task objects
+        scheduled_tasks = []
+        missed = []
+        for idx in order:
+            task = table.tasks[idx]
             
-            # Check if task can meet deadline
-            if task.deadline and current_time + timedelta(minutes=task.duration) > task.deadline:
-                print(f"⚠️  Warning: Task {task.id} might miss deadline!")
+            # Check if task could meet its deadline
+            if table.end_min[idx] > table.deadline_min[idx]:
+                missed.append(task.id)
                 
-            # Schedule the task
-            task.start_time = current_time
-            task.end_time = current_time + timedelta(minutes=task.duration)
-            task.status = TaskStatus.RUNNING
-            
-            # Simulate task execution
-            current_time = task.end_time
-            task.status = TaskStatus.COMPLETED
-            
+            task.start_time = self.epoch + timedelta(minutes=table.start_min[idx])
+            task.end_time = self.epoch + timedelta(minutes=table.end_min[idx])
+            task._status = Task.COMPLETED
             scheduled_tasks.append(task)
-            self.completed_tasks.append(task)
+            self.completed_ids.add(task.id)
             
-            # Remove from active tasks
-            del self.tasks[task.id]
-            
-            # Check for new ready tasks
-            new_ready_tasks = self.get_ready_tasks()
-            for new_task in new_ready_tasks:
-                if new_task not in task_queue and new_task not in scheduled_tasks:
-                    heapq.heappush(task_queue, new_task)
+            # No longer pending; the task itself stays in the catalog
+            self.pending_ids.discard(task.id)
+            self.dependents.pop(task.id, None)
+        self.completed_order.extend(scheduled_tasks)
+        # Keep the table, and so the next run's CSR, sized by pending tasks
+        for task in scheduled_tasks:
+            table.remove(task.id)
+        
+        if missed:
+            print(f"⚠️  Warning: Tasks might miss their deadlines: {', '.join(missed)}")
                     
         return scheduled_tasks
     
     def calculate_metrics(self, scheduled_tasks: List[Task]) -> Dict[str, Any]:
         """Calculate scheduling performance metrics"""
         total_tasks = len(scheduled_tasks)
-        completed_on_time = 0
-        total_tardiness = 0
-        total_completion_time = 0
-        
-        for task in scheduled_tasks:
-            if task.deadline and task.end_time <= task.deadline:
-                completed_on_time += 1
-                
-            if task.deadline:
-                tardiness = max(0, (task.end_time - task.deadline).total_seconds() / 60)
-                total_tardiness += tardiness
-                
-            total_completion_time += task.duration
+        # Minutes past the deadline (negative when early) for every deadlined task
+        lateness = [
+            (t.end_time - t.deadline).total_seconds() / 60 for t in scheduled_tasks if t.deadline
+        ]
+        completed_on_time = sum(1 for late in lateness if late <= 0)
+        total_tardiness = sum(late for late in lateness if late > 0)
+        total_completion_time = sum(t.duration for t in scheduled_tasks)
             
         return {
             "total_tasks": total_tasks,
@@ -169,6 +395,9 @@ def get_user_input():
         # Dependencies
         dependencies_input = input("Enter dependencies (comma-separated, e.g., T1,T2 or press Enter for none): ").strip()
         dependencies = [dep.strip() for dep in dependencies_input.split(',')] if dependencies_input else []
+        if task_id in dependencies:
+            print("A task cannot depend on itself!")
+            continue
         
         # Deadline
         deadline = None
@@ -202,14 +431,19 @@ def get_user_input():
 
 def display_schedule(scheduled_tasks: List[Task]):
     """Display the scheduled tasks in a formatted way"""
-    print("\n" + "📅 FINAL SCHEDULE".center(80, "="))
-    print(f"{'Task':<10} {'Start Time':<20} {'End Time':<20} {'Duration':<10} {'Status':<12}")
-    print("-" * 80)
+    lines = [
+        "\n" + "📅 FINAL SCHEDULE".center(80, "="),
+        f"{'Task':<10} {'Start Time':<20} {'End Time':<20} {'Duration':<10} {'Status':<12}",
+        "-" * 80,
+    ]
     
     for task in scheduled_tasks:
-        start_str = task.start_time.strftime("%Y-%m-%d %H:%M") if task.start_time else "N/A"
-        end_str = task.end_time.strftime("%Y-%m-%d %H:%M") if task.end_time else "N/A"
-        print(f"{task.id:<10} {start_str:<20} {end_str:<20} {task.duration:<10} {task.status.value:<12}")
+        start_str = task.start_time.isoformat(" ", "minutes") if task.start_time else "N/A"
+        end_str = task.end_time.isoformat(" ", "minutes") if task.end_time else "N/A"
+        lines.append(f"{task.id:<10} {start_str:<20} {end_str:<20} {task.duration:<10} {task.status.value:<12}")
+    
+    # One write for the whole table instead of a print per row
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def display_metrics(metrics: Dict[str, Any]):
     """Display performance metrics in a formatted way"""
@@ -270,12 +504,13 @@ def main():
             scheduler = TaskScheduler()
             
             # Create sample tasks
+            base = datetime.now()
             sample_tasks = [
-                Task("T1", 30, priority=5, deadline=datetime.now() + timedelta(hours=2)),
-                Task("T2", 45, priority=8, dependencies=["T1"], deadline=datetime.now() + timedelta(hours=3)),
-                Task("T3", 20, priority=3, deadline=datetime.now() + timedelta(hours=1)),
-                Task("T4", 60, priority=6, dependencies=["T2"], deadline=datetime.now() + timedelta(hours=4)),
-                Task("T5", 15, priority=9, deadline=datetime.now() + timedelta(hours=1)),
+                Task("T1", 30, priority=5, deadline=base + timedelta(hours=2)),
+                Task("T2", 45, priority=8, dependencies=["T1"], deadline=base + timedelta(hours=3)),
+                Task("T3", 20, priority=3, deadline=base + timedelta(hours=1)),
+                Task("T4", 60, priority=6, dependencies=["T2"], deadline=base + timedelta(hours=4)),
+                Task("T5", 15, priority=9, deadline=base + timedelta(hours=1)),
             ]
             
             for task in sample_tasks:
@@ -0,0 +1,342 @@
+import contextlib
+import io
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from task_scheduler import Task, TaskScheduler, TaskStatus, display_schedule
+
+
+def run(tasks):
+    """Schedule the tasks on a fresh scheduler, silencing warnings"""
+    scheduler = TaskScheduler()
+    for task in tasks:
+        scheduler.add_task(task)
+    with contextlib.redirect_stdout(io.StringIO()):
+        scheduled = scheduler.schedule_tasks()
+    return scheduler, scheduled
+
+
+def ids(tasks):
+    return [task.id for task in tasks]
+
+
+class TaskTest(unittest.TestCase):
+    def test_tasks_sort_by_scheduling_order(self):
+        base = datetime(2030, 1, 1)
+        tasks = [Task("low", 5, priority=1), Task("undated", 5, priority=5),
+                 Task("dated", 50, priority=5, deadline=base), Task("high", 90, priority=9)]
+        self.assertEqual(ids(sorted(tasks)), ["high", "dated", "undated", "low"])
+
+    def test_sort_order_follows_current_fields(self):
+        base = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        soon, late = Task("soon", 5, deadline=base), Task("late", 5, deadline=base + timedelta(hours=1))
+        self.assertEqual(ids(sorted([late, soon])), ["soon", "late"])
+        late.priority = 2
+        self.assertEqual(ids(sorted([soon, late])), ["late", "soon"])
+
+    def test_rejects_invalid_priority(self):
+        for priority in (0, 11, 5.5):
+            with self.assertRaises(ValueError):
+                Task("A", 5, priority=priority)
+
+    def test_dependencies_are_deduplicated(self):
+        self.assertEqual(Task("A", 5, dependencies=["B", "C", "B"]).dependencies, ["B", "C"])
+
+    def test_rejects_self_dependency(self):
+        with self.assertRaises(ValueError):
+            Task("A", 5, dependencies=["A"])
+
+    def test_status_maps_to_enum(self):
+        task = Task("A", 5)
+        self.assertEqual(task.status, TaskStatus.PENDING)
+        task.status = TaskStatus.RUNNING
+        self.assertEqual(task._status, Task.RUNNING)
+        self.assertEqual(task.status, TaskStatus.RUNNING)
+
+    def test_rejects_invalid_status(self):
+        task = Task("A", 5)
+        with self.assertRaises(ValueError):
+            task.status = "completed"
+        self.assertEqual(task.status, TaskStatus.PENDING)
+
+    def test_tasks_have_no_instance_dict(self):
+        self.assertFalse(hasattr(Task("A", 5), "__dict__"))
+
+
+class ScheduleOrderTest(unittest.TestCase):
+    def test_dag_order(self):
+        base = datetime.now()
+        _, scheduled = run([
+            Task("T1", 30, priority=5, deadline=base + timedelta(hours=2)),
+            Task("T2", 45, priority=8, dependencies=["T1"], deadline=base + timedelta(hours=3)),
+            Task("T3", 20, priority=3, deadline=base + timedelta(hours=1)),
+            Task("T4", 60, priority=6, dependencies=["T2"], deadline=base + timedelta(hours=4)),
+            Task("T5", 15, priority=9, deadline=base + timedelta(hours=1)),
+        ])
+        # A released task competes with everything still queued
+        self.assertEqual(ids(scheduled), ["T5", "T1", "T2", "T4", "T3"])
+
+    def test_equal_priority_breaks_ties_on_deadline_or_duration(self):
+        base = datetime.now()
+        _, scheduled = run([Task("late", 10, priority=5, deadline=base + timedelta(hours=5)),
+                            Task("soon", 40, priority=5, deadline=base + timedelta(hours=1))])
+        self.assertEqual(ids(scheduled), ["soon", "late"])
+        _, scheduled = run([Task("long", 50, priority=5), Task("short", 10, priority=5)])
+        self.assertEqual(ids(scheduled), ["short", "long"])
+
+    def test_deadlined_task_precedes_undeadlined_at_equal_priority(self):
+        base = datetime.now()
+        _, scheduled = run([Task("short", 10, priority=5),
+                            Task("due", 40, priority=5, deadline=base + timedelta(hours=5))])
+        self.assertEqual(ids(scheduled), ["due", "short"])
+
+    def test_tasks_run_back_to_back(self):
+        _, scheduled = run([Task("A", 30, priority=2), Task("B", 15, priority=1, dependencies=["A"])])
+        a, b = scheduled
+        self.assertAlmostEqual((a.end_time - a.start_time).total_seconds(), 30 * 60, places=3)
+        self.assertEqual(b.start_time, a.end_time)
+        self.assertAlmostEqual((b.end_time - b.start_time).total_seconds(), 15 * 60, places=3)
+        self.assertTrue(all(task.status == TaskStatus.COMPLETED for task in scheduled))
+
+    def test_fractional_durations(self):
+        _, scheduled = run([Task("A", 1.5)])
+        self.assertAlmostEqual((scheduled[0].end_time - scheduled[0].start_time).total_seconds(), 90, places=3)
+
+    def test_times_are_exact(self):
+        scheduler, scheduled = run([Task("A", 30, priority=2), Task("B", 1.5, priority=1)])
+        a, b = scheduled
+        self.assertEqual(a.start_time, scheduler.current_time)
+        self.assertEqual(a.end_time - a.start_time, timedelta(minutes=30))
+        self.assertEqual(b.end_time - b.start_time, timedelta(seconds=90))
+        self.assertEqual(scheduler.calculate_metrics(scheduled)["makespan"], 31.5)
+
+    def test_sorted_path_matches_queue_path(self):
+        def independent():
+            base = datetime(2030, 1, 1)
+            return [
+                Task(f"T{i}", duration, priority=priority,
+                     deadline=base + timedelta(hours=hours) if hours else None)
+                for i, (duration, priority, hours) in enumerate([
+                    (10, 3, None), (20, 7, 2), (5, 7, None), (15, 7, 1),
+                    (30, 3, 4), (10, 3, None), (25, 1, None),
+                ])
+            ]
+
+        _, sorted_path = run(independent())
+        # A task that can never run sends the rest through the bucket queue
+        _, queue_path = run(independent() + [Task("blocked", 5, dependencies=["missing"])])
+        self.assertEqual(ids(sorted_path), ids(queue_path))
+        self.assertEqual(ids(sorted_path), ["T3", "T1", "T2", "T4", "T0", "T5", "T6"])
+
+    def test_completed_order_logs_every_run(self):
+        scheduler, _ = run([Task("A", 10, priority=2), Task("B", 10, priority=1)])
+        scheduler.add_task(Task("C", 10))
+        with contextlib.redirect_stdout(io.StringIO()):
+            scheduler.schedule_tasks()
+        self.assertEqual(ids(scheduler.completed_order), ["A", "B", "C"])
+
+    def test_each_run_starts_now(self):
+        scheduler = TaskScheduler()
+        scheduler.current_time = datetime(2000, 1, 1)
+        scheduler.add_task(Task("A", 10))
+        before = datetime.now()
+        with contextlib.redirect_stdout(io.StringIO()):
+            scheduled = scheduler.schedule_tasks()
+        after = datetime.now()
+        self.assertTrue(before - timedelta(milliseconds=1) <= scheduled[0].start_time <= after)
+        self.assertTrue(before <= scheduler.current_time <= after)
+
+
+class ReadyTasksTest(unittest.TestCase):
+    def test_get_ready_tasks(self):
+        scheduler = TaskScheduler()
+        for task in [Task("A", 10), Task("B", 10, dependencies=["A"]), Task("C", 10)]:
+            scheduler.add_task(task)
+        self.assertEqual(ids(scheduler.get_ready_tasks()), ["A", "C"])
+        with contextlib.redirect_stdout(io.StringIO()):
+            scheduler.schedule_tasks()
+        self.assertEqual(scheduler.get_ready_tasks(), [])
+
+
+class BlockedTaskTest(unittest.TestCase):
+    def test_missing_and_circular_dependencies_are_not_scheduled(self):
+        scheduler, scheduled = run([
+            Task("A", 10),
+            Task("B", 10, dependencies=["missing"]),
+            Task("C", 10, dependencies=["D"]),
+            Task("D", 10, dependencies=["C"]),
+        ])
+        self.assertEqual(ids(scheduled), ["A"])
+        self.assertEqual(scheduler.tasks["C"].status, TaskStatus.PENDING)
+
+    def test_unscheduled_tasks_stay_pending(self):
+        scheduler, _ = run([
+            Task("A", 10),
+            Task("B", 10, dependencies=["A", "missing"]),
+            Task("C", 10, dependencies=["D"]),
+            Task("D", 10, dependencies=["C"]),
+        ])
+        self.assertEqual(scheduler.pending_ids, {"B", "C", "D"})
+
+
+class AddRemoveTest(unittest.TestCase):
+    def test_remove_before_run(self):
+        scheduler = TaskScheduler()
+        for task in [Task("A", 10), Task("B", 10, dependencies=["A"]), Task("C", 10)]:
+            scheduler.add_task(task)
+        scheduler.remove_task("C")
+        scheduler.remove_task("A")
+        scheduler.add_task(Task("A", 5))
+        with contextlib.redirect_stdout(io.StringIO()):
+            scheduled = scheduler.schedule_tasks()
+        self.assertEqual(ids(scheduled), ["A", "B"])
+        self.assertEqual(scheduled[0].duration, 5)
+
+    def test_ties_keep_insertion_order_after_remove(self):
+        for extra in ([], [Task("blocked", 5, dependencies=["missing"])]):
+            scheduler = TaskScheduler()
+            for task in [Task("A", 10), Task("B", 10), Task("C", 10)] + extra:
+                scheduler.add_task(task)
+            scheduler.remove_task("A")
+            scheduler.add_task(Task("D", 10))
+            self.assertEqual(ids(scheduler.get_ready_tasks()), ["B", "C", "D"])
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(ids(scheduler.schedule_tasks()), ["B", "C", "D"])
+
+    def test_add_after_run(self):
+        scheduler, first = run([Task("A", 10, priority=5), Task("B", 5, priority=9, dependencies=["A"])])
+        self.assertEqual(ids(first), ["A", "B"])
+        # Dependencies on already completed tasks are satisfied
+        scheduler.add_task(Task("C", 3, priority=4, dependencies=["A"]))
+        scheduler.add_task(Task("A", 2, priority=4))
+        with contextlib.redirect_stdout(io.StringIO()):
+            second = scheduler.schedule_tasks()
+        self.assertEqual(ids(second), ["A", "C"])
+
+    def test_catalog_keeps_scheduled_tasks(self):
+        scheduler, _ = run([Task("A", 10), Task("B", 10, dependencies=["A"])])
+        self.assertEqual(set(scheduler.tasks), {"A", "B"})
+        self.assertEqual(scheduler.pending_ids, set())
+
+    def test_remove_after_run(self):
+        scheduler, _ = run([Task("A", 10), Task("B", 10)])
+        scheduler.remove_task("A")
+        self.assertNotIn("A", scheduler.tasks)
+        scheduler.add_task(Task("A", 4))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(ids(scheduler.schedule_tasks()), ["A"])
+
+    def test_table_holds_only_pending_tasks(self):
+        scheduler, _ = run([Task("A", 10), Task("B", 10, dependencies=["A"]),
+                            Task("C", 10, dependencies=["missing"])])
+        self.assertEqual(scheduler.table.tasks, [scheduler.tasks["C"]])
+        scheduler.add_task(Task("D", 10, dependencies=["C"]))
+        indptr, _ = scheduler._child_csr()
+        self.assertEqual(len(indptr), 3)
+        scheduler.remove_task("A")
+        scheduler.add_task(Task("missing", 5))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(ids(scheduler.schedule_tasks()), ["missing", "C", "D"])
+        self.assertEqual(len(scheduler.table), 0)
+
+    def test_changes_after_add_are_scheduled(self):
+        for extra in ([], [Task("blocked", 5, dependencies=["missing"])]):
+            scheduler = TaskScheduler()
+            a, b = Task("A", 10, priority=5), Task("B", 10, priority=3)
+            for task in [a, b] + extra:
+                scheduler.add_task(task)
+            b.priority = 9
+            b.duration = 20
+            with contextlib.redirect_stdout(io.StringIO()):
+                scheduled = scheduler.schedule_tasks()
+            self.assertEqual(ids(scheduled), ["B", "A"])
+            self.assertEqual(b.end_time - b.start_time, timedelta(minutes=20))
+            self.assertEqual(a.start_time, b.end_time)
+
+
+class MetricsTest(unittest.TestCase):
+    def test_metrics_of_a_run(self):
+        scheduler = TaskScheduler()
+        start = scheduler.current_time
+        for task in [Task("A", 30, priority=3, deadline=start + timedelta(minutes=40)),
+                     Task("B", 30, priority=2, deadline=start + timedelta(minutes=50)),
+                     Task("C", 20, priority=1)]:
+            scheduler.add_task(task)
+        with contextlib.redirect_stdout(io.StringIO()):
+            scheduled = scheduler.schedule_tasks()
+        metrics = scheduler.calculate_metrics(scheduled)
+        self.assertEqual(metrics["total_tasks"], 3)
+        self.assertEqual(metrics["completed_on_time"], 1)
+        self.assertAlmostEqual(metrics["on_time_percentage"], 100 / 3)
+        self.assertAlmostEqual(metrics["average_tardiness"], 10 / 3, places=3)
+        self.assertEqual(metrics["total_completion_time"], 80)
+        self.assertAlmostEqual(metrics["makespan"], 80, places=3)
+
+    def test_metrics_of_empty_schedule(self):
+        metrics = TaskScheduler().calculate_metrics([])
+        self.assertEqual(metrics["total_tasks"], 0)
+        self.assertEqual(metrics["makespan"], 0)
+
+    def test_metrics_from_task_times(self):
+        start = datetime(2030, 1, 1, 9, 0)
+        tasks = [Task("A", 30, deadline=start + timedelta(minutes=40)),
+                 Task("B", 30, deadline=start + timedelta(minutes=50)),
+                 Task("C", 20)]
+        for task, offset in zip(tasks, (0, 30, 60)):
+            task.start_time = start + timedelta(minutes=offset)
+            task.end_time = task.start_time + timedelta(minutes=task.duration)
+        self.assertEqual(TaskScheduler().calculate_metrics(tasks), {
+            "total_tasks": 3,
+            "completed_on_time": 1,
+            "on_time_percentage": 1 / 3 * 100,
+            "average_tardiness": 10 / 3,
+            "total_completion_time": 80,
+            "makespan": 80.0,
+        })
+
+    def test_metrics_survive_later_changes(self):
+        scheduler, scheduled = run([Task("A", 30), Task("B", 30)])
+        expected = scheduler.calculate_metrics(scheduled)
+        scheduler.add_task(Task("B", 999))
+        self.assertEqual(scheduler.calculate_metrics(scheduled), expected)
+        scheduler.remove_task("A")
+        self.assertEqual(scheduler.calculate_metrics(scheduled), expected)
+        self.assertEqual(TaskScheduler().calculate_metrics(scheduled), expected)
+
+
+class DisplayTest(unittest.TestCase):
+    def test_display_schedule(self):
+        start = datetime(2030, 1, 1, 9, 0, 30)
+        done = Task("A", 90)
+        done.start_time, done.end_time = start, start + timedelta(minutes=90)
+        done.status = TaskStatus.COMPLETED
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            display_schedule([done, Task("B", 5)])
+        self.assertEqual(out.getvalue().split("\n"), [
+            "",
+            "📅 FINAL SCHEDULE".center(80, "="),
+            f"{'Task':<10} {'Start Time':<20} {'End Time':<20} {'Duration':<10} {'Status':<12}",
+            "-" * 80,
+            f"{'A':<10} {'2030-01-01 09:00':<20} {'2030-01-01 10:30':<20} {90:<10} {'completed':<12}",
+            f"{'B':<10} {'N/A':<20} {'N/A':<20} {5:<10} {'pending':<12}",
+            "",
+        ])
+
+
+class WarningTest(unittest.TestCase):
+    def test_missed_deadlines_are_reported_once(self):
+        scheduler = TaskScheduler()
+        due = scheduler.current_time
+        for task in [Task("A", 10, priority=3, deadline=due),
+                     Task("B", 10, priority=2, deadline=due),
+                     Task("C", 10, priority=1)]:
+            scheduler.add_task(task)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            scheduler.schedule_tasks()
+        self.assertEqual(out.getvalue(), "⚠️  Warning: Tasks might miss their deadlines: A, B\n")
+
+
+if __name__ == "__main__":
+    unittest.main()